@@ -1,16 +1,12 @@
 #!/usr/bin/env python3
-import sys
-print(f"--- sys.path START ---\n{sys.path}\n--- sys.path END ---")
-
-print("--- PIP FREEZE START ---")
-import subprocess
-subprocess.run(["pip", "freeze"])
-print("--- PIP FREEZE END ---")
-
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 import uvicorn
+import asyncio
 import inspect
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List
 import contextlib # Added for lifespan management
 
@@ -29,15 +25,30 @@ mcp_server_app = FastMCP(
 
 # --- Define tools for MCP, wrapping calls to dwave_logic ---
 
+# Classify every public method of the DWave logic instance once at import
+# time, so the per-request path is a single dict lookup instead of
+# getattr + inspect.iscoroutinefunction on every MCP tool call.
+_METHOD_TABLE: Dict[str, tuple] = {
+    name: (getattr(dwave_logic, name), inspect.iscoroutinefunction(attr))
+    for name, attr in vars(type(dwave_logic)).items()
+    if not name.startswith("_") and callable(attr)
+}
+
+# Sync methods that can block the event loop for a meaningful amount of
+# time (annealing sweeps, large-Q parsing, or eventually real D-Wave RPCs).
+# These run in a worker thread; the cheap status getters stay inline to
+# avoid the thread-handoff overhead.
+_HEAVY_SYNC = frozenset({"solve_problem", "create_qubo", "create_ising"})
+
 # Helper to call dwave_logic methods (sync or async)
 async def _call_dwave_method(method_name: str, *args, **kwargs) -> Any:
-    method = getattr(dwave_logic, method_name)
-    if inspect.iscoroutinefunction(method):
+    method, is_async = _METHOD_TABLE[method_name]
+    if is_async:
         return await method(*args, **kwargs)
-    else:
-        # Consider running sync methods in a thread pool if they are blocking
-        # For now, direct call for simplicity, assuming non-blocking or short operations
-        return method(*args, **kwargs)
+    if method_name in _HEAVY_SYNC:
+        return await asyncio.to_thread(method, *args, **kwargs)
+    # Cheap sync methods are pure dict work; call them inline.
+    return method(*args, **kwargs)
 
 @mcp_server_app.tool()
 async def get_simulator_status() -> Dict[str, Any]:
@@ -77,6 +88,11 @@ async def solve_problem(problem_id: str, num_reads: int = 100, annealing_time: i
 # Lifespan manager for FastMCP session
 @contextlib.asynccontextmanager
 async def mcp_lifespan(app: FastAPI):
+    # Size the pool the heavy sync calls run on; the default executor is
+    # shared with asyncio.to_thread.
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
+    )
     print("MCP Lifespan: Starting FastMCP session manager...")
     async with mcp_server_app.session_manager.run():
         print("MCP Lifespan: FastMCP session manager started.")
@@ -84,17 +100,36 @@ async def mcp_lifespan(app: FastAPI):
     print("MCP Lifespan: FastMCP session manager stopped.")
 
 # Create FastAPI app, using the custom lifespan
-app = FastAPI(lifespan=mcp_lifespan)
+app = FastAPI(lifespan=mcp_lifespan, default_response_class=ORJSONResponse)
 
 # Mount the MCP application at /
 # This will handle /mcp/initialize, /mcp/request, /mcp/stream etc. if the app itself serves these paths
 app.mount("/", mcp_server_app.streamable_http_app())
 
-# Optional: Health check or root path
-@app.get("/")
+# Optional: Health check or root path. Health checks hammer this endpoint,
+# so the body is pre-encoded bytes rather than a dict run through the
+# jsonable_encoder pipeline per request.
+_ROOT_BODY = b'{"message":"DWave MCP Server is running. MCP endpoint at /mcp"}'
+
+@app.get("/", response_class=Response)
 async def root():
-    return {"message": "DWave MCP Server is running. MCP endpoint at /mcp"}
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 if __name__ == "__main__":
-    # It is crucial that uvicorn runs the 'app' object from this script
-    uvicorn.run("api_server:app", host="0.0.0.0", port=3000, reload=False) 
\ No newline at end of file
+    # It is crucial that uvicorn runs the 'app' object from this script.
+    # uvloop + httptools replace the default selector loop and pure-Python
+    # h11 parser. Single worker only: problems/results and the FastMCP
+    # session manager live in per-process memory, so N workers sharing one
+    # socket would lose sessions and problem IDs across requests. Scale out
+    # only once that state is externalized or routing is sticky.
+    uvicorn.run(
+        "api_server:app",
+        host="0.0.0.0",
+        port=3000,
+        loop="uvloop",
+        http="httptools",
+        workers=1,
+        limit_concurrency=1000,
+        timeout_keep_alive=30,
+        reload=False,
+    )
\ No newline at end of file
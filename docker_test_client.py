@@ -1,21 +1,71 @@
 #!/usr/bin/env python3
 import asyncio
+import contextlib
 import json
-import time # Keep for potential delays if needed, though MCPClient might handle waits
+import orjson
+
+import httpx
 
 from mcp import ClientSession # ClientSession is directly available
 from mcp.client.streamable_http import streamablehttp_client # Correct import
-# from mcp.types import HttpUrl # Removed as it's not found; URL is likely a string
 
 # The URL for the MCP server run by FastAPI in Docker
 # streamablehttp_client expects the full URL.
 MCP_SERVER_URL = "http://localhost:3001/mcp/"
 
+# Keep-alive pool shared by every request in the process; a fresh
+# connection per call pays DNS + TCP + TLS handshake each time.
+_HTTPX_LIMITS = httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30)
+
+def _httpx_client_factory(headers=None, timeout=None, auth=None):
+    """Build the httpx client used by the MCP transport (keep-alive pool).
+
+    HTTP/1.1 only: the server is plain-HTTP uvicorn without TLS, so HTTP/2
+    would never be negotiated (and http2=True needs the optional h2 package).
+    """
+    return httpx.AsyncClient(
+        headers=headers,
+        timeout=timeout,
+        auth=auth,
+        limits=_HTTPX_LIMITS,
+        follow_redirects=True,
+    )
+
+# One initialized ClientSession cached for the life of the process, so N
+# tool calls share a single transport instead of paying a handshake each.
+_session = None
+_session_stack = None
+_session_lock = asyncio.Lock()
+
+@contextlib.asynccontextmanager
+async def mcp_session():
+    """Yield a shared, already-initialized MCP ClientSession."""
+    global _session, _session_stack
+    async with _session_lock:
+        if _session is None:
+            stack = contextlib.AsyncExitStack()
+            read_stream, write_stream, _ = await stack.enter_async_context(
+                streamablehttp_client(url=MCP_SERVER_URL, httpx_client_factory=_httpx_client_factory)
+            )
+            session = await stack.enter_async_context(ClientSession(read_stream, write_stream))
+            init_payload = await session.initialize()
+            print(f"MCP Initialize successful. Response: {init_payload}")
+            _session, _session_stack = session, stack
+    yield _session
+
+async def close_mcp_session():
+    """Tear down the shared session and its transport."""
+    global _session, _session_stack
+    async with _session_lock:
+        if _session_stack is not None:
+            await _session_stack.aclose()
+            _session = _session_stack = None
+
 def print_exception_group(ex_group, indent=0):
     """Recursively prints exceptions from an ExceptionGroup."""
     if not hasattr(ex_group, 'exceptions') or not isinstance(ex_group.exceptions, (list, tuple)):
         return
-    
+
     prefix = "  " * indent
     print(f"{prefix}Contained exceptions in {type(ex_group).__name__}: {ex_group.message if hasattr(ex_group, 'message') else str(ex_group)}")
     for i, sub_ex in enumerate(ex_group.exceptions):
@@ -30,60 +80,53 @@ async def test_dockerized_mcp_server():
 
     try:
         print(f"Attempting to connect to MCP server at {MCP_SERVER_URL}...")
-        async with streamablehttp_client(url=MCP_SERVER_URL) as (read_stream, write_stream, _http_client_instance):
-            print("HTTP transport connected. Creating MCP ClientSession...")
-            async with ClientSession(read_stream, write_stream) as session:
-                print("MCP ClientSession created. Attempting to initialize session...")
-                init_payload = await session.initialize()
-                print(f"MCP Initialize successful. Response: {init_payload}")
-
-                print("Attempting to list tools...")
-                tools_response = await session.list_tools()
-                tools = tools_response.tools
-                
-                if not tools:
-                    print("No tools found on the server.")
-                    return
-
-                print(f"Successfully received {len(tools)} tools:")
-                for tool_obj in tools:
-                    print(f"  - {tool_obj.name}: {tool_obj.description}")
-
-                # Test the get_simulator_status tool
-                print("\nTesting get_simulator_status tool...")
-                call_tool_response = await session.call_tool(name="get_simulator_status", arguments={})
-                result_text = call_tool_response.content[0].text
-                result = json.loads(result_text)
-                print(f"Result: {json.dumps(result, indent=2)}")
+        async with mcp_session() as session:
+            print("Attempting to list tools...")
+            tools_response = await session.list_tools()
+            tools = tools_response.tools
 
-                # Test the create_qubo tool
-                print("\nTesting create_qubo tool...")
-                qubo_args = {
-                    "Q": {"0,0": -1, "1,1": -1, "0,1": 2},
-                    "description": "Simple QUBO example via mcp.client"
-                }
-                call_tool_response = await session.call_tool(name="create_qubo", arguments=qubo_args)
-                result_text = call_tool_response.content[0].text
-                result = json.loads(result_text)
-                print(f"Result: {json.dumps(result, indent=2)}")
+            if not tools:
+                print("No tools found on the server.")
+                return
 
-                problem_id = result.get("problem_id")
+            print(f"Successfully received {len(tools)} tools:")
+            for tool_obj in tools:
+                print(f"  - {tool_obj.name}: {tool_obj.description}")
 
-                if problem_id:
-                    print(f"\nTesting solve_problem tool with problem_id {problem_id}...")
-                    solve_args = {"problem_id": problem_id}
-                    call_tool_response = await session.call_tool(name="solve_problem", arguments=solve_args)
-                    result_text = call_tool_response.content[0].text
-                    result = json.loads(result_text)
-                    print(f"Result: {json.dumps(result, indent=2)}")
-                else:
-                    print("Skipping solve_problem tool as problem_id was not retrieved.")
+            # get_simulator_status and create_qubo are independent of each
+            # other, so issue them concurrently over the shared session and
+            # only the dependent solve_problem waits on a prior result.
+            print("\nTesting get_simulator_status and create_qubo tools (batched)...")
+            qubo_args = {
+                "Q": {"0,0": -1, "1,1": -1, "0,1": 2},
+                "description": "Simple QUBO example via mcp.client"
+            }
+            status_response, create_response = await asyncio.gather(
+                session.call_tool(name="get_simulator_status", arguments={}),
+                session.call_tool(name="create_qubo", arguments=qubo_args),
+            )
+            status_result = orjson.loads(status_response.content[0].text)
+            print(f"get_simulator_status result: {json.dumps(status_result, indent=2)}")
+            result = orjson.loads(create_response.content[0].text)
+            print(f"create_qubo result: {json.dumps(result, indent=2)}")
+
+            problem_id = result.get("problem_id")
+
+            if problem_id:
+                print(f"\nTesting solve_problem tool with problem_id {problem_id}...")
+                solve_args = {"problem_id": problem_id}
+                call_tool_response = await session.call_tool(name="solve_problem", arguments=solve_args)
+                result_text = call_tool_response.content[0].text
+                result = orjson.loads(result_text)
+                print(f"Result: {json.dumps(result, indent=2)}")
+            else:
+                print("Skipping solve_problem tool as problem_id was not retrieved.")
 
-                print("\nTest completed successfully!")
+            print("\nTest completed successfully!")
 
     except ImportError:
         # This is to catch potential issues if anyio is not installed, though it should be a dep of httpx/mcp.
-        print("Error: 'anyio' library might be missing or related import failed. Please ensure it is installed.") 
+        print("Error: 'anyio' library might be missing or related import failed. Please ensure it is installed.")
         raise
     except Exception as e:
         print(f"Error during test: {type(e).__name__}: {e}")
@@ -94,7 +137,8 @@ async def test_dockerized_mcp_server():
         else:
             import traceback
             traceback.print_exc() # For any other unexpected errors
-    # Context managers will handle cleanup.
+    finally:
+        await close_mcp_session()
 
 if __name__ == "__main__":
-    asyncio.run(test_dockerized_mcp_server()) 
\ No newline at end of file
+    asyncio.run(test_dockerized_mcp_server())
@@ -0,0 +1,62 @@
+"""Vectorized simulated-annealing kernel for the mock D-Wave server.
+
+Operates directly on the structure-of-arrays (rows, cols, vals) problem
+representation produced at create time. All reads are annealed in
+parallel as one (num_reads, num_variables) state matrix, so the
+Metropolis sweep is a handful of numpy ops instead of a Python loop over
+reads and variables.
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+def _energies(states: np.ndarray, rows: np.ndarray, cols: np.ndarray, vals: np.ndarray,
+              h_index: Optional[np.ndarray] = None, h_vals: Optional[np.ndarray] = None) -> np.ndarray:
+    """Compute the energy of every state (row) in one vectorized pass."""
+    energies = (states[:, rows] * states[:, cols]).astype(np.float64) @ vals
+    if h_index is not None and h_index.size:
+        energies += states[:, h_index].astype(np.float64) @ h_vals
+    return energies
+
+
+def anneal(rows: np.ndarray, cols: np.ndarray, vals: np.ndarray, num_variables: int,
+           num_reads: int = 100, num_sweeps: int = 10,
+           h_index: Optional[np.ndarray] = None, h_vals: Optional[np.ndarray] = None,
+           spin: bool = False, seed: Optional[int] = None) -> Tuple[float, np.ndarray]:
+    """Run Metropolis sweeps over num_reads parallel states.
+
+    For QUBO problems states are 0/1; for Ising (spin=True) they are -1/+1
+    and h_index/h_vals carry the linear biases. Returns the lowest energy
+    found and its state vector.
+    """
+    if num_reads <= 0:
+        raise ValueError("num_reads must be positive")
+    if num_variables == 0:
+        return 0.0, np.empty(0, dtype=np.int8)
+
+    rng = np.random.default_rng(seed)
+    if spin:
+        states = rng.choice(np.array([-1, 1], dtype=np.int8), size=(num_reads, num_variables))
+    else:
+        states = rng.integers(0, 2, size=(num_reads, num_variables), dtype=np.int8)
+    energies = _energies(states, rows, cols, vals, h_index, h_vals)
+
+    read_index = np.arange(num_reads)
+    for beta in np.geomspace(0.1, 10.0, num_sweeps):
+        # Propose one random flip per read, all reads at once
+        flip = rng.integers(0, num_variables, size=num_reads)
+        candidates = states.copy()
+        if spin:
+            candidates[read_index, flip] = -candidates[read_index, flip]
+        else:
+            candidates[read_index, flip] = 1 - candidates[read_index, flip]
+
+        candidate_energies = _energies(candidates, rows, cols, vals, h_index, h_vals)
+        delta = candidate_energies - energies
+        accept = (delta < 0) | (rng.random(num_reads) < np.exp(-beta * np.clip(delta, 0.0, 50.0)))
+        states[accept] = candidates[accept]
+        energies[accept] = candidate_energies[accept]
+
+    best = int(np.argmin(energies))
+    return float(energies[best]), states[best]
@@ -1,9 +1,12 @@
 import os
-import json
-import uuid
-from typing import Dict, Any, Sequence, Optional
+import itertools
+import random
+from typing import Dict, Any, Sequence, Optional, Tuple
 from enum import Enum
 
+import numpy as np
+import orjson
+
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
@@ -11,6 +14,8 @@ from mcp.shared.exceptions import McpError
 
 from pydantic import BaseModel
 
+from ._anneal import anneal
+
 # Placeholders for test mocking compatibility
 class DWaveSampler: pass
 class EmbeddingComposite: pass
@@ -23,38 +28,129 @@ class DWaveTools(str, Enum):
     SOLVE_PROBLEM = "solve_problem"
     GET_ANNEALING_TIME_STATUS = "get_annealing_time_status"
 
+# Problem/result IDs are not security sensitive, so they come from a
+# pre-seeded PRNG plus a monotonic counter instead of uuid.uuid4(), which
+# pays a getrandom(2) syscall per ID.
+_ID_RNG = random.Random(os.urandom(16))
+_ID_COUNTER = itertools.count()
+
+# Cap on stored problems/results per server; without one, long-running
+# workers grow without bound and eventually OOM.
+_MAX_STORED = int(os.environ.get("DWAVE_MAX_PROBLEMS", 10_000))
+
+def _new_id() -> str:
+    """Generate a unique, non-cryptographic problem/result ID."""
+    return f"{next(_ID_COUNTER):08x}{_ID_RNG.getrandbits(32):08x}"
+
+def _parse_pair_keys(d: Dict[Any, float]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Parse a {"(i,j)": v} / {(i,j): v} mapping into (rows, cols, vals) arrays.
+
+    Large QUBO matrices can have N^2 entries, so the string keys are parsed
+    in a single vectorized numpy pass rather than per-entry strip/split/int.
+    The structure-of-arrays form also avoids boxing a Python tuple and float
+    per coefficient.
+    """
+    if not d:
+        empty_idx = np.empty(0, dtype=np.int32)
+        return empty_idx, empty_idx, np.empty(0, dtype=np.float64)
+
+    keys = list(d.keys())
+    vals = np.fromiter(d.values(), dtype=np.float64, count=len(keys))
+    if isinstance(keys[0], str):
+        # Strip parentheses and split on the comma, all in compiled code
+        parts = np.char.partition(np.char.strip(np.asarray(keys), "()"), ",")
+        rows = parts[:, 0].astype(np.int32)
+        cols = parts[:, 2].astype(np.int32)
+    else:
+        # Keys are already (i, j) tuples
+        rows = np.fromiter((k[0] for k in keys), dtype=np.int32, count=len(keys))
+        cols = np.fromiter((k[1] for k in keys), dtype=np.int32, count=len(keys))
+    return rows, cols, vals
+
+def _to_upper_triangular(rows: np.ndarray, cols: np.ndarray, vals: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Fold the lower triangle of a coefficient matrix into the upper one.
+
+    D-Wave solvers expect an upper-triangular Q, and Q[j,i] contributes to
+    the same bilinear term as Q[i,j]. Doing the reduction once at problem
+    creation (mirror the lower triangle, then coalesce duplicate
+    coordinates) keeps every later solve a straight scan over sorted,
+    deduplicated arrays.
+    """
+    if rows.size == 0:
+        return rows, cols, vals
+
+    lower = rows > cols
+    r = np.where(lower, cols, rows)
+    c = np.where(lower, rows, cols)
+
+    # Sort by (row, col) and sum values of coalescing coordinates
+    order = np.lexsort((c, r))
+    r, c, v = r[order], c[order], vals[order]
+    first = np.empty(r.size, dtype=bool)
+    first[0] = True
+    np.logical_or(r[1:] != r[:-1], c[1:] != c[:-1], out=first[1:])
+    starts = np.flatnonzero(first)
+    return r[starts], c[starts], np.add.reduceat(v, starts)
+
 class ServerConfig:
     """Configuration for D-Wave server."""
+    __slots__ = ("use_simulator", "simulator_type")
+
     def __init__(self, use_simulator: bool = True):
         self.use_simulator = use_simulator
         self.simulator_type = "dwave"
 
 class DWaveServer:
     """Simulated D-Wave quantum computing server."""
-    
+    __slots__ = ("config", "problems", "results", "_status_cache", "_status_json")
+
     def __init__(self, config: Optional[ServerConfig] = None):
         self.config = config or ServerConfig(use_simulator=True)
-        # Storage for problems and results
+        # Storage for problems and results. Plain dicts are insertion
+        # ordered; _store evicts the least recently used entry once
+        # _MAX_STORED is reached, keeping steady-state memory bounded.
         self.problems = {}
         self.results = {}
-    
-    def get_simulator_status(self):
-        """Get current simulator status."""
-        return {
+        # Status payloads only change when the config does, so build them
+        # (and their serialized form) once and invalidate on config updates.
+        self._rebuild_status_cache()
+
+    @staticmethod
+    def _store(cache: dict, key: str, value: Any):
+        """Insert into an LRU-capped store, evicting the oldest entry if full."""
+        if len(cache) >= _MAX_STORED:
+            evicted = next(iter(cache))
+            del cache[evicted]
+            print(f"Evicted least-recently-used entry {evicted} (cap {_MAX_STORED})")
+        cache[key] = value
+
+    def _rebuild_status_cache(self):
+        """Recompute the cached status payload and its JSON serialization."""
+        self._status_cache = {
             "use_simulator": self.config.use_simulator,
             "simulator_type": self.config.simulator_type,
             "using_simulator": self.config.use_simulator,
             "quantum_hardware_available": False
         }
-    
+        self._status_json = orjson.dumps(self._status_cache).decode()
+
+    def get_simulator_status(self):
+        """Get current simulator status."""
+        return self._status_cache
+
+    def get_simulator_status_json(self) -> str:
+        """Get the simulator status as preserialized JSON text."""
+        return self._status_json
+
     def set_simulator_config(self, use_simulator: bool, simulator_type: str):
         """Update simulator configuration."""
         if simulator_type not in ["dwave", "neal"]:
             raise ValueError(f"Invalid simulator_type: {simulator_type}. Must be 'dwave' or 'neal'.")
-        
+
         self.config.use_simulator = use_simulator
         self.config.simulator_type = simulator_type
-        
+        self._rebuild_status_cache()
+
         return {
             "use_simulator": self.config.use_simulator,
             "simulator_type": self.config.simulator_type,
@@ -63,94 +159,95 @@ class DWaveServer:
     
     def create_qubo(self, Q: Dict[str, float], description: str = ""):
         """Create a QUBO problem."""
-        problem_id = str(uuid.uuid4())
-        
-        # Convert string key format "(i,j)" to proper format
-        formatted_Q = {}
-        for k, v in Q.items():
-            if isinstance(k, str) and "," in k:
-                # Strip parentheses and parse as tuple
-                stripped = k.strip("()")
-                i, j = map(int, stripped.split(","))
-                formatted_Q[(i, j)] = float(v)
-            else:
-                formatted_Q[k] = float(v)
-        
+        problem_id = _new_id()
+
+        # Parse "(i,j)" keys in one vectorized pass into (rows, cols, vals),
+        # then reduce to the upper-triangular form solvers consume
+        rows, cols, vals = _to_upper_triangular(*_parse_pair_keys(Q))
+
         problem = {
             "problem_id": problem_id,
             "type": "qubo",
-            "Q": formatted_Q,
+            "rows": rows,
+            "cols": cols,
+            "vals": vals,
             "description": description
         }
-        
-        self.problems[problem_id] = problem
-        
+
+        self._store(self.problems, problem_id, problem)
+
         return {
             "problem_id": problem_id,
             "type": "qubo",
             "description": description,
-            "num_variables": len(set([i for i, j in formatted_Q.keys()] + [j for i, j in formatted_Q.keys()]))
+            "num_variables": int(np.unique(np.concatenate((rows, cols))).size)
         }
-    
+
     def create_ising(self, h: Dict[str, float], J: Dict[str, float], description: str = ""):
         """Create an Ising model problem."""
-        problem_id = str(uuid.uuid4())
-        
-        # Convert string indices to integers for h
-        formatted_h = {int(i) if isinstance(i, str) else i: float(v) for i, v in h.items()}
-        
-        # Convert string key format "(i,j)" to proper format for J
-        formatted_J = {}
-        for k, v in J.items():
-            if isinstance(k, str) and "," in k:
-                # Strip parentheses and parse as tuple
-                stripped = k.strip("()")
-                i, j = map(int, stripped.split(","))
-                formatted_J[(i, j)] = float(v)
-            else:
-                formatted_J[k] = float(v)
-        
+        problem_id = _new_id()
+
+        # Convert string indices to integers for the linear biases
+        h_index = np.fromiter((int(i) for i in h), dtype=np.int32, count=len(h))
+        h_vals = np.fromiter(h.values(), dtype=np.float64, count=len(h))
+
+        # Parse "(i,j)" keys for J in one vectorized pass and fold the
+        # couplings into the upper triangle
+        j_rows, j_cols, j_vals = _to_upper_triangular(*_parse_pair_keys(J))
+
         problem = {
             "problem_id": problem_id,
             "type": "ising",
-            "h": formatted_h,
-            "J": formatted_J,
+            "h_index": h_index,
+            "h_vals": h_vals,
+            "rows": j_rows,
+            "cols": j_cols,
+            "vals": j_vals,
             "description": description
         }
-        
-        self.problems[problem_id] = problem
-        
+
+        self._store(self.problems, problem_id, problem)
+
         return {
             "problem_id": problem_id,
             "type": "ising",
             "description": description,
-            "num_variables": len(formatted_h)
+            "num_variables": len(h)
         }
     
     def solve_problem(self, problem_id: str, num_reads: int = 100, annealing_time: int = 20, **kwargs):
         """Solve a quantum problem."""
-        # num_reads and annealing_time are accepted but currently ignored by this mock implementation
         if problem_id not in self.problems:
             raise ValueError(f"Problem ID {problem_id} not found")
-        
-        # In a real implementation, this would interface with D-Wave's API
-        # For now, return a mock result with a simple solution
-        result_id = str(uuid.uuid4())
-        
-        # Generate a mock solution (in real implementation, this would come from quantum computer)
-        if self.problems[problem_id]["type"] == "qubo":
-            solution = {str(var): 0 for var in range(5)}  # Mock 5 variables
-            solution["0"] = 1  # Just set a simple solution
-            solution["2"] = 1
+        # Re-insert to mark the problem most recently used
+        self.problems[problem_id] = self.problems.pop(problem_id)
+
+        # In a real implementation, this would interface with D-Wave's API.
+        # Here the vectorized annealing kernel runs directly on the stored
+        # (rows, cols, vals) arrays; annealing_time (us) scales the sweeps.
+        result_id = _new_id()
+        problem = self.problems[problem_id]
+        num_sweeps = max(1, annealing_time // 2)
+
+        rows, cols, vals = problem["rows"], problem["cols"], problem["vals"]
+        if problem["type"] == "qubo":
+            num_variables = int(max(rows.max(initial=-1), cols.max(initial=-1))) + 1
+            energy, state = anneal(rows, cols, vals, num_variables,
+                                   num_reads=num_reads, num_sweeps=num_sweeps)
         else:  # ising
-            solution = {str(var): -1 for var in range(5)}  # Mock 5 variables
-            solution["0"] = 1
-            solution["3"] = 1
-        
+            h_index, h_vals = problem["h_index"], problem["h_vals"]
+            num_variables = int(max(rows.max(initial=-1), cols.max(initial=-1),
+                                    h_index.max(initial=-1))) + 1
+            energy, state = anneal(rows, cols, vals, num_variables,
+                                   num_reads=num_reads, num_sweeps=num_sweeps,
+                                   h_index=h_index, h_vals=h_vals, spin=True)
+
+        solution = {str(var): int(value) for var, value in enumerate(state)}
+
         result = {
             "result_id": result_id,
             "problem_id": problem_id,
-            "energy": -1.5,  # Mock energy value
+            "energy": energy,
             "solution": solution,
             "qpu_access_time": 0.05,  # Mock execution time, aliased for tests
             "execution_time": 0.05,  # Mock execution time
@@ -158,179 +255,212 @@ class DWaveServer:
             "status": "COMPLETED"
         }
         
-        self.results[result_id] = result
+        self._store(self.results, result_id, result)
         
         return result
     
     def get_annealing_time_status(self):
         """Get annealing time status."""
-        # Mock values for keys expected by tests
-        # Assuming total_annealing_time is in seconds, and total_annealing_time_ns is in nanoseconds
-        # The ServerConfig and its time limiting features were removed, so these are just fixed mock values.
-        mock_total_annealing_time_s = 0.0 
-        mock_time_limit_s = 0.1 
-        mock_remaining_time_s = mock_time_limit_s - mock_total_annealing_time_s
+        return _ANNEALING_TIME_STATUS
 
-        return {
-            "min_annealing_time_ns": 200,
-            "max_annealing_time_ns": 2000,
-            "current_annealing_time_ns": 500, # Kept for existing behavior
-            "total_annealing_time_ns": 500,   # Added for test: test_annealing_time_limit
-            "time_limit": mock_time_limit_s,             # Added for tests
-            "total_annealing_time": mock_total_annealing_time_s, # Added for tests
-            "remaining_time": mock_remaining_time_s      # Added for tests
-        }
+    def get_annealing_time_status_json(self) -> str:
+        """Get the annealing time status as preserialized JSON text."""
+        return _ANNEALING_TIME_STATUS_JSON
+
+# Mock values for keys expected by tests.
+# total_annealing_time is in seconds, total_annealing_time_ns in nanoseconds.
+# The ServerConfig time limiting features were removed, so these are fixed
+# mock values; being entirely constant they are built (and serialized) once.
+_MOCK_TOTAL_ANNEALING_TIME_S = 0.0
+_MOCK_TIME_LIMIT_S = 0.1
+
+_ANNEALING_TIME_STATUS = {
+    "min_annealing_time_ns": 200,
+    "max_annealing_time_ns": 2000,
+    "current_annealing_time_ns": 500, # Kept for existing behavior
+    "total_annealing_time_ns": 500,   # Added for test: test_annealing_time_limit
+    "time_limit": _MOCK_TIME_LIMIT_S,             # Added for tests
+    "total_annealing_time": _MOCK_TOTAL_ANNEALING_TIME_S, # Added for tests
+    "remaining_time": _MOCK_TIME_LIMIT_S - _MOCK_TOTAL_ANNEALING_TIME_S # Added for tests
+}
+_ANNEALING_TIME_STATUS_JSON = orjson.dumps(_ANNEALING_TIME_STATUS).decode()
 
 def main(config: Optional[ServerConfig] = None) -> DWaveServer:
     """Create and return a new D-Wave server instance."""
     return DWaveServer(config)
 
+# The tool schemas are static, so build the Tool models once at import
+# instead of revalidating six nested Pydantic models per list_tools call.
+_TOOLS = [
+    Tool(
+        name=DWaveTools.GET_SIMULATOR_STATUS.value,
+        description="Get the status of the D-Wave quantum simulator",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+    Tool(
+        name=DWaveTools.SET_SIMULATOR_CONFIG.value,
+        description="Configure the D-Wave simulator settings",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "use_simulator": {
+                    "type": "boolean",
+                    "description": "Whether to use the simulator instead of real quantum hardware"
+                },
+                "simulator_type": {
+                    "type": "string",
+                    "description": "Type of simulator to use",
+                    "enum": ["dwave", "neal"]
+                }
+            },
+        },
+    ),
+    Tool(
+        name=DWaveTools.CREATE_QUBO.value,
+        description="Create a Quadratic Unconstrained Binary Optimization (QUBO) problem",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "Q": {
+                    "type": "object",
+                    "description": "QUBO matrix as a nested dictionary or dictionary with string keys like '(0,1)'"
+                },
+                "description": {
+                    "type": "string",
+                    "description": "Optional description of the problem"
+                }
+            },
+            "required": ["Q"]
+        },
+    ),
+    Tool(
+        name=DWaveTools.CREATE_ISING.value,
+        description="Create an Ising model problem",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "h": {
+                    "type": "object",
+                    "description": "Linear biases dictionary with variable indices as keys"
+                },
+                "J": {
+                    "type": "object",
+                    "description": "Quadratic biases dictionary with keys like '(0,1)' representing variable pairs"
+                },
+                "description": {
+                    "type": "string",
+                    "description": "Optional description of the problem"
+                }
+            },
+            "required": ["h", "J"]
+        },
+    ),
+    Tool(
+        name=DWaveTools.SOLVE_PROBLEM.value,
+        description="Solve a quantum problem using D-Wave's quantum computer or simulator",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "problem_id": {
+                    "type": "string",
+                    "description": "ID of the problem to solve"
+                }
+            },
+            "required": ["problem_id"]
+        },
+    ),
+    Tool(
+        name=DWaveTools.GET_ANNEALING_TIME_STATUS.value,
+        description="Get information about quantum annealing time settings",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+]
+
 async def serve(use_simulator: bool = True):
     """Serve the D-Wave MCP server."""
     server = Server("mcp-dwave-quantum")
     dwave_server = main(ServerConfig(use_simulator=use_simulator))
 
+    # Constant responses are wrapped into complete TextContent frames up
+    # front; call_tool hands them back without touching Pydantic or JSON.
+    # The simulator-status frame is rebuilt whenever the config changes.
+    def _simulator_status_frame() -> list[TextContent]:
+        return [TextContent(type="text", text=dwave_server.get_simulator_status_json())]
+
+    preserialized = {
+        DWaveTools.GET_SIMULATOR_STATUS.value: _simulator_status_frame(),
+        DWaveTools.GET_ANNEALING_TIME_STATUS.value: [
+            TextContent(type="text", text=dwave_server.get_annealing_time_status_json())
+        ],
+    }
+
+    def _handle_set_simulator_config(arguments: dict):
+        use_simulator = arguments.get("use_simulator", True)
+        simulator_type = arguments.get("simulator_type", "dwave")
+        result = dwave_server.set_simulator_config(use_simulator, simulator_type)
+        preserialized[DWaveTools.GET_SIMULATOR_STATUS.value] = _simulator_status_frame()
+        return result
+
+    def _handle_create_qubo(arguments: dict):
+        if "Q" not in arguments:
+            raise McpError("Missing required parameter: Q")
+        return dwave_server.create_qubo(arguments.get("Q", {}), arguments.get("description", ""))
+
+    def _handle_create_ising(arguments: dict):
+        if "h" not in arguments or "J" not in arguments:
+            raise McpError("Missing required parameters: h and J")
+        return dwave_server.create_ising(
+            arguments.get("h", {}), arguments.get("J", {}), arguments.get("description", "")
+        )
+
+    def _handle_solve_problem(arguments: dict):
+        if "problem_id" not in arguments:
+            raise McpError("Missing required parameter: problem_id")
+        return dwave_server.solve_problem(arguments.get("problem_id"))
+
+    # O(1) tool dispatch; adding a tool means adding an entry, not a branch
+    handlers = {
+        DWaveTools.SET_SIMULATOR_CONFIG.value: _handle_set_simulator_config,
+        DWaveTools.CREATE_QUBO.value: _handle_create_qubo,
+        DWaveTools.CREATE_ISING.value: _handle_create_ising,
+        DWaveTools.SOLVE_PROBLEM.value: _handle_solve_problem,
+    }
+
     @server.list_tools()
     async def list_tools() -> list[Tool]:
         """List available D-Wave quantum computing tools."""
-        return [
-            Tool(
-                name=DWaveTools.GET_SIMULATOR_STATUS.value,
-                description="Get the status of the D-Wave quantum simulator",
-                inputSchema={
-                    "type": "object",
-                    "properties": {},
-                },
-            ),
-            Tool(
-                name=DWaveTools.SET_SIMULATOR_CONFIG.value,
-                description="Configure the D-Wave simulator settings",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "use_simulator": {
-                            "type": "boolean",
-                            "description": "Whether to use the simulator instead of real quantum hardware"
-                        },
-                        "simulator_type": {
-                            "type": "string",
-                            "description": "Type of simulator to use",
-                            "enum": ["dwave", "neal"]
-                        }
-                    },
-                },
-            ),
-            Tool(
-                name=DWaveTools.CREATE_QUBO.value,
-                description="Create a Quadratic Unconstrained Binary Optimization (QUBO) problem",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "Q": {
-                            "type": "object",
-                            "description": "QUBO matrix as a nested dictionary or dictionary with string keys like '(0,1)'"
-                        },
-                        "description": {
-                            "type": "string",
-                            "description": "Optional description of the problem"
-                        }
-                    },
-                    "required": ["Q"]
-                },
-            ),
-            Tool(
-                name=DWaveTools.CREATE_ISING.value,
-                description="Create an Ising model problem",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "h": {
-                            "type": "object",
-                            "description": "Linear biases dictionary with variable indices as keys"
-                        },
-                        "J": {
-                            "type": "object",
-                            "description": "Quadratic biases dictionary with keys like '(0,1)' representing variable pairs"
-                        },
-                        "description": {
-                            "type": "string",
-                            "description": "Optional description of the problem"
-                        }
-                    },
-                    "required": ["h", "J"]
-                },
-            ),
-            Tool(
-                name=DWaveTools.SOLVE_PROBLEM.value,
-                description="Solve a quantum problem using D-Wave's quantum computer or simulator",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "problem_id": {
-                            "type": "string",
-                            "description": "ID of the problem to solve"
-                        }
-                    },
-                    "required": ["problem_id"]
-                },
-            ),
-            Tool(
-                name=DWaveTools.GET_ANNEALING_TIME_STATUS.value,
-                description="Get information about quantum annealing time settings",
-                inputSchema={
-                    "type": "object",
-                    "properties": {},
-                },
-            ),
-        ]
+        return _TOOLS
 
     @server.call_tool()
     async def call_tool(
         name: str, arguments: dict
     ) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
         """Handle tool calls for D-Wave quantum computing operations."""
+        frame = preserialized.get(name)
+        if frame is not None:
+            return frame
+
+        handler = handlers.get(name)
+        if handler is None:
+            raise McpError(f"Unknown tool: {name}")
+
+        # Only translate expected validation failures into McpError;
+        # CancelledError/TimeoutError must propagate so client disconnects
+        # cancel cleanly instead of leaking tasks.
         try:
-            result = None
-            
-            if name == DWaveTools.GET_SIMULATOR_STATUS.value:
-                result = dwave_server.get_simulator_status()
-                
-            elif name == DWaveTools.SET_SIMULATOR_CONFIG.value:
-                use_simulator = arguments.get("use_simulator", True)
-                simulator_type = arguments.get("simulator_type", "dwave")
-                result = dwave_server.set_simulator_config(use_simulator, simulator_type)
-                
-            elif name == DWaveTools.CREATE_QUBO.value:
-                if "Q" not in arguments:
-                    raise McpError("Missing required parameter: Q")
-                Q = arguments.get("Q", {})
-                description = arguments.get("description", "")
-                result = dwave_server.create_qubo(Q, description)
-                
-            elif name == DWaveTools.CREATE_ISING.value:
-                if "h" not in arguments or "J" not in arguments:
-                    raise McpError("Missing required parameters: h and J")
-                h = arguments.get("h", {})
-                J = arguments.get("J", {})
-                description = arguments.get("description", "")
-                result = dwave_server.create_ising(h, J, description)
-                
-            elif name == DWaveTools.SOLVE_PROBLEM.value:
-                if "problem_id" not in arguments:
-                    raise McpError("Missing required parameter: problem_id")
-                problem_id = arguments.get("problem_id")
-                result = dwave_server.solve_problem(problem_id)
-                
-            elif name == DWaveTools.GET_ANNEALING_TIME_STATUS.value:
-                result = dwave_server.get_annealing_time_status()
-                
-            else:
-                raise McpError(f"Unknown tool: {name}")
-            
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        except Exception as e:
-            raise McpError(f"Error processing D-Wave server query: {str(e)}")
+            result = handler(arguments)
+            return [TextContent(type="text", text=orjson.dumps(result).decode())]
+
+        except McpError:
+            raise
+        except (ValueError, KeyError, TypeError) as e:
+            raise McpError(f"Error processing D-Wave server query: {str(e)}") from e
 
     options = server.create_initialization_options()
     async with stdio_server() as (read_stream, write_stream):